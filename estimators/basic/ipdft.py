@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, Literal
+import operator
+from typing import Any, Literal, cast
 
 import numpy as np
 from numpy.typing import NDArray
@@ -10,6 +11,16 @@ from estimators.base import EstimatorBase
 from utils.pmu.pmu_input import PMU_Input
 from utils.pmu.pmu_output import PhasorName, PMU_Output
 
+try:  # FFT acceleration is optional (install extra: "signal")
+    import pyfftw
+except ImportError:  # pragma: no cover - depends on environment
+    pyfftw = None
+
+# Shared across instances: one attrgetter call fetches all six channels as a
+# tuple, avoiding per-sample getattr dispatch in the hot update path.
+_PHASOR_KEYS: tuple[PhasorName, ...] = ("V1", "V2", "V3", "I1", "I2", "I3")
+_PHASORS_GET = operator.attrgetter(*_PHASOR_KEYS)
+
 
 class IpDFT(EstimatorBase):
     """
@@ -19,7 +30,12 @@ class IpDFT(EstimatorBase):
       - fs: float                 (required) sampling rate [Hz]
       - frame_len: int            (default 50) samples per frame
       - channel: str              (default "V1") PMU_Input field to read
+      - channels: list[str]       (optional) track several channels at once;
+                                  one batched rfft/interpolation serves all
+                                  of them (per-channel results in
+                                  ``channel_freqs``)
       - nominal_hz: float         (default 60.0) used before buffer fills
+      - ring_len: int             (default 1024) slots in the SoA output ring
     """
 
     def __init__(
@@ -45,48 +61,428 @@ class IpDFT(EstimatorBase):
 
         self.channel: str = str(g("channel", "V1"))
         self.nominal_hz: float = float(g("nominal_hz", 60.0))
+        self._chan_get = operator.attrgetter(self.channel)
+
+        # Optional multi-channel mode: one (C, frame_len) buffer, one batched
+        # rfft and one vectorized interpolation serve all tracked channels.
+        cfg_channels = g("channels", None)
+        if cfg_channels:
+            chs = tuple(c for c in cfg_channels if c in _PHASOR_KEYS)
+            self.channels: tuple[PhasorName, ...] = cast(
+                "tuple[PhasorName, ...]", chs or (self.channel,)
+            )
+        else:
+            self.channels = cast("tuple[PhasorName, ...]", (self.channel,))
+        self._multi: bool = len(self.channels) > 1
+        self._primary_idx: int = (
+            self.channels.index(self.channel) if self.channel in self.channels else 0
+        )
+        self.channel_freqs: NDArray[np.float64] | None = None
+
+        # Constants fixed for the life of the estimator — folded here so the
+        # per-sample path does no repeated attribute math.
+        self._half: int = self.frame_len // 2
+        self._fs_over_n: float = self.fs / self.frame_len
 
-        self.buffer: NDArray[np.float64] = np.zeros(self.frame_len, dtype=float)
+        # Mirror double-buffer: every sample is written at ptr and at
+        # ptr + frame_len, so buffer[ptr : ptr + frame_len] is always a
+        # contiguous, time-ordered view of the current frame — no modulo
+        # arithmetic in the hot path and no unrolling copy before the FFT.
+        # float32 is plenty for IpDFT at these frame lengths (interpolation
+        # error dominates the mantissa) and halves FFT memory traffic.
+        self.buffer: NDArray[np.float32] = np.zeros(2 * self.frame_len, dtype=np.float32)
         self.ptr: int = 0
         self.filled: bool = False
 
+        # Sliding-DFT state: only the peak bin and its two neighbors are
+        # tracked between full-spectrum refreshes (3 bins suffice for the
+        # parabolic interpolation).
+        self._k: int = 0
+        self._k_interior: bool = False
+        self._X3: NDArray[np.complex128] = np.zeros(3, dtype=np.complex128)
+        self._tw: NDArray[np.complex128] = np.ones(3, dtype=np.complex128)
+        self._refresh_every: int = max(1, self.frame_len // 4)
+        self._since_refresh: int = 0
+        self._synced: bool = False
+
+        # Channel-axis twins of the scalar state above, used in multi mode.
+        if self._multi:
+            self._init_multi_state()
+
         self._last_freq: float | None = None
         self._last_ts: float | None = None
 
+        # Bulk-ingest continuity state for update_many(): the trailing
+        # frame_len - 1 samples of the previous block plus the last emitted
+        # estimate, so consecutive blocks behave like one stream.
+        self._bulk_tail: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self._bulk_last_freq: float | None = None
+        self._bulk_last_ts: float | None = None
+
+        self._init_ring(int(g("ring_len", 1024)))
+
+        # Cached FFTW plan (when pyfftw is available): the refresh transform
+        # reuses one aligned in/out buffer pair instead of re-entering the
+        # pocketfft dispatcher for every small-N rfft.
+        if pyfftw is not None:  # pragma: no cover - depends on environment
+            self._fft_in: NDArray[np.float64] = pyfftw.empty_aligned(
+                self.frame_len, dtype="float64"
+            )
+            self._fft_out: NDArray[np.complex128] = pyfftw.empty_aligned(
+                self.frame_len // 2 + 1, dtype="complex128"
+            )
+            self._fft_plan = pyfftw.FFTW(self._fft_in, self._fft_out, flags=("FFTW_ESTIMATE",))
+        else:
+            self._fft_plan = None
+
+    def _init_multi_state(self) -> None:
+        """Allocate the channel-axis twins of the scalar sliding-DFT state."""
+        n_ch = len(self.channels)
+        self._mc_get = operator.attrgetter(*self.channels)
+        self._mc_buffer: NDArray[np.float32] = np.zeros(
+            (n_ch, 2 * self.frame_len), dtype=np.float32
+        )
+        self._mc_k: NDArray[np.intp] = np.zeros(n_ch, dtype=np.intp)
+        self._mc_interior: NDArray[np.bool_] = np.zeros(n_ch, dtype=bool)
+        self._mc_X3: NDArray[np.complex128] = np.zeros((n_ch, 3), dtype=np.complex128)
+        self._mc_tw: NDArray[np.complex128] = np.ones((n_ch, 3), dtype=np.complex128)
+
+    def _init_ring(self, ring_len: int) -> None:
+        """Preallocate the SoA output ring: every update also records into
+        these arrays so sinks can drain whole blocks via flush() instead of
+        keeping per-sample PMU_Output objects alive."""
+        self._ring_len: int = ring_len
+        if self._ring_len <= 0:
+            raise ValueError("IpDFT requires ring_len >= 1")
+        self._ts_ring: NDArray[np.float64] = np.zeros(self._ring_len, dtype=float)
+        self._f_ring: NDArray[np.float64] = np.zeros(self._ring_len, dtype=float)
+        self._r_ring: NDArray[np.float64] = np.zeros(self._ring_len, dtype=float)
+        self._ph_ring: NDArray[np.complex128] = np.zeros((self._ring_len, 6), dtype=np.complex128)
+        self._ring_i: int = 0
+        self._ring_n: int = 0
+
+    def _rfft_frame(self, frame: NDArray[np.float32]) -> NDArray[np.complex128]:
+        """rfft of one frame through the cached FFTW plan when available."""
+        if self._fft_plan is not None:  # pragma: no cover - depends on environment
+            self._fft_in[:] = frame
+            self._fft_plan()
+            return self._fft_out
+        return np.fft.rfft(frame)
+
     def reset(self) -> None:
         self.buffer.fill(0.0)
         self.ptr = 0
         self.filled = False
+        self._k = 0
+        self._k_interior = False
+        self._X3.fill(0.0)
+        self._tw.fill(1.0)
+        self._since_refresh = 0
+        self._synced = False
+        if self._multi:
+            self._mc_buffer.fill(0.0)
+            self._mc_k.fill(0)
+            self._mc_interior.fill(False)
+            self._mc_X3.fill(0.0)
+            self._mc_tw.fill(1.0)
+        self.channel_freqs = None
         self._last_freq = None
         self._last_ts = None
+        self._bulk_tail = np.zeros(0, dtype=np.float32)
+        self._bulk_last_freq = None
+        self._bulk_last_ts = None
+        self._ring_i = 0
+        self._ring_n = 0
         super().reset()
 
+    def update_many(
+        self,
+        xs: NDArray[np.float64],
+        tss: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Bulk-ingest M samples of the primary channel at once.
+
+        One rfft over all M overlapping frames (built zero-copy with
+        ``sliding_window_view``) plus the vectorized interpolation of
+        ``estimate_freq_batch`` replaces M interpreted ``update`` calls.
+        Continuity across calls is kept via an internal tail buffer, so
+        feeding a stream in blocks matches feeding it in one piece.
+
+        Parameters
+        ----------
+        xs, tss : NDArray[np.float64]
+            Samples and their timestamps (seconds), same 1-D length.
+
+        Returns
+        -------
+        (freq_hz, rocof_hz_s)
+            Per-sample arrays of length M; nominal frequency (and zero
+            RoCoF) until a full frame of history exists.
+
+        Notes
+        -----
+        This path is independent of the streaming ``update`` state; do not
+        interleave the two on one instance without calling ``reset``.
+        """
+        xs32 = np.asarray(xs, dtype=np.float32).ravel()
+        tss = np.asarray(tss, dtype=np.float64).ravel()
+        if xs32.shape != tss.shape:
+            raise ValueError("update_many requires xs and tss of equal length")
+        m = xs32.shape[0]
+        n = self.frame_len
+
+        full = np.concatenate([self._bulk_tail, xs32])
+        freq = np.full(m, self.nominal_hz, dtype=np.float64)
+        if full.shape[0] >= n:
+            frames = np.lib.stride_tricks.sliding_window_view(full, n)
+            # window j ends at input sample j + n - 1 - len(tail)
+            start = n - 1 - self._bulk_tail.shape[0]
+            freq[max(start, 0) :] = self.estimate_freq_batch(frames, self.fs)
+
+        # finite-difference RoCoF, seeded from the previous block's estimate
+        rocof = np.zeros(m, dtype=np.float64)
+        if m:
+            dt = np.diff(tss)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rocof[1:] = np.where(dt > 0.0, np.diff(freq) / dt, 0.0)
+            if self._bulk_last_freq is not None and self._bulk_last_ts is not None:
+                dt0 = tss[0] - self._bulk_last_ts
+                rocof[0] = (freq[0] - self._bulk_last_freq) / dt0 if dt0 > 0.0 else 0.0
+            self._bulk_tail = full[-(n - 1) :].copy() if n > 1 else full[:0]
+            self._bulk_last_freq = float(freq[-1])
+            self._bulk_last_ts = float(tss[-1])
+
+        return freq, rocof
+
+    def flush(
+        self,
+    ) -> tuple[
+        NDArray[np.float64],
+        NDArray[np.float64],
+        NDArray[np.float64],
+        NDArray[np.complex128],
+    ]:
+        """
+        Drain the SoA output ring accumulated since the last flush.
+
+        Returns
+        -------
+        (timestamps, frequency_hz, rocof_hz_s, phasors)
+            Chronologically ordered arrays of shape (n,) / (n, 6). If more
+            than ``ring_len`` samples arrived since the last flush, only the
+            newest ``ring_len`` are retained.
+        """
+        n, i, k = self._ring_n, self._ring_i, self._ring_len
+        order = np.arange(i - n, i) % k
+        out = (
+            self._ts_ring[order].copy(),
+            self._f_ring[order].copy(),
+            self._r_ring[order].copy(),
+            self._ph_ring[order].copy(),
+        )
+        self._ring_n = 0
+        return out
+
+    def _refresh_bins(self) -> None:
+        """Re-identify the peak bin from a full rfft and reseed the 3-bin state.
+
+        Run every ``frame_len // 4`` samples: re-anchors the tracked bins when
+        the spectral peak migrates and flushes accumulated recurrence rounding.
+        """
+        X: NDArray[np.complex128] = self._rfft_frame(self._frame())
+        half = self._half
+        mag2: NDArray[np.float64] = X.real * X.real + X.imag * X.imag
+        # Clamp so that both neighbors exist for the tracked 3-bin window;
+        # interpolation is only valid when the raw argmax was interior (an
+        # edge peak clamped onto bin 1 is not a local max of the window and
+        # the parabola denominator degenerates).
+        k_raw = int(np.argmax(mag2[:half]))
+        k = min(max(k_raw, 1), half - 2)
+        self._k_interior = k == k_raw
+
+        bins = np.arange(k - 1, k + 2, dtype=float)
+        # The mirror buffer view is already time-ordered, so the transform
+        # seeds the sliding recurrence directly — no phase correction needed.
+        self._k = k
+        # accumulate the sliding recurrence in complex128 even off a float32
+        # transform: the buffer precision is enough for the spectrum, the
+        # recurrence accumulator is not
+        self._X3 = X[k - 1 : k + 2].astype(np.complex128)
+        self._tw = np.exp(2j * np.pi * bins / self.frame_len)
+        self._since_refresh = 0
+        self._synced = True
+
+    def _frame(self) -> NDArray[np.float32]:
+        """Contiguous, time-ordered view of the current frame (zero-copy)."""
+        return self.buffer[self.ptr : self.ptr + self.frame_len]
+
+    def _refresh_bins_multi(self) -> None:
+        """Multi-channel reseed: one rfft over the channel axis, vectorized
+        argmax and fancy-indexed gathering of each channel's 3 peak bins."""
+        frames = self._mc_buffer[:, self.ptr : self.ptr + self.frame_len]
+        X = np.fft.rfft(frames, axis=1)
+        half = self._half
+        mag2 = X.real * X.real + X.imag * X.imag
+
+        k = np.argmax(mag2[:, :half], axis=1)
+        # Remember which channels had a genuinely interior peak: a clamped
+        # edge bin is not a local max and must not be interpolated.
+        self._mc_interior = (k >= 1) & (k < half - 1)
+        np.clip(k, 1, half - 2, out=k)
+
+        rows = np.arange(k.shape[0])[:, None]
+        bins = k[:, None] + np.array([-1, 0, 1])
+        self._mc_k = k
+        self._mc_X3 = X[rows, bins].astype(np.complex128)
+        self._mc_tw = np.exp(2j * np.pi * bins / self.frame_len)
+        self._since_refresh = 0
+        self._synced = True
+
+    def _estimate_freq_multi(self) -> NDArray[np.float64]:
+        """Per-channel frequencies [Hz] from the tracked (C, 3) sliding DFT."""
+        X3 = self._mc_X3
+        mag = np.sqrt(X3.real * X3.real + X3.imag * X3.imag)
+        denom = mag[:, 0] - 2.0 * mag[:, 1] + mag[:, 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = np.where(denom != 0.0, 0.5 * (mag[:, 0] - mag[:, 2]) / denom, 0.0)
+        # Same guard as the scalar path: interpolate only where the tracked
+        # bin was interior at the last reseed and is still the local max of
+        # its window, which keeps delta bounded in [-0.5, 0.5] per channel.
+        ok = self._mc_interior & (mag[:, 1] >= mag[:, 0]) & (mag[:, 1] >= mag[:, 2])
+        delta = np.where(ok, delta, 0.0)
+        return np.asarray((self._mc_k + delta) * self._fs_over_n, dtype=np.float64)
+
     def _estimate_freq(self) -> float:
-        """Return IpDFT frequency [Hz] from the current full buffer."""
-        X: NDArray[np.complex128] = np.fft.fft(self.buffer, n=self.frame_len)
-        half = self.frame_len // 2
-        mag: NDArray[np.float64] = np.abs(X[:half])
-        k: int = int(np.argmax(mag))  # 0..half-1
-        if 1 <= k < len(mag) - 1:
-            denom = mag[k - 1] - 2.0 * mag[k] + mag[k + 1]
-            delta = 0.5 * (mag[k - 1] - mag[k + 1]) / denom if denom != 0.0 else 0.0
+        """Return IpDFT frequency [Hz] from the tracked 3-bin sliding DFT."""
+        # No interpolation when the tracked bin was clamped to the spectrum
+        # edge (same guard as estimate_freq_batch's interior mask): the
+        # parabola fit around a non-peak bin produces unbounded deltas.
+        if not self._k_interior:
+            return float(self._k * self._fs_over_n)
+        # Squared magnitudes would bias the parabola fit; sqrt exactly the
+        # three bins the interpolation consumes (vs N/2 for a full |X|).
+        X3 = self._X3
+        mag = np.sqrt(X3.real * X3.real + X3.imag * X3.imag)
+        denom = mag[0] - 2.0 * mag[1] + mag[2]
+        # Interpolate only while the center bin is still the local max of the
+        # window (the sliding recurrence can let it drift off-peak between
+        # refreshes); with that invariant delta is bounded in [-0.5, 0.5].
+        if denom != 0.0 and mag[1] >= mag[0] and mag[1] >= mag[2]:
+            delta = 0.5 * (mag[0] - mag[2]) / denom
         else:
             delta = 0.0
-        return float((k + delta) * self.fs / self.frame_len)
+        return float((self._k + delta) * self._fs_over_n)
+
+    @classmethod
+    def estimate_freq_batch(cls, buffers: NDArray[np.float64], fs: float) -> NDArray[np.float64]:
+        """
+        Vectorized IpDFT over a stack of frames.
+
+        Parameters
+        ----------
+        buffers : NDArray[np.float64]
+            Shape (n_frames, frame_len); each row is one analysis frame.
+        fs : float
+            Sampling rate [Hz].
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Shape (n_frames,) frequency estimates [Hz], one per frame.
+
+        A single rfft over the batch axis amortizes dispatch cost versus
+        per-frame calls; argmax and the parabolic interpolation are applied
+        row-wise with fancy indexing.
+        """
+        frames = np.asarray(buffers, dtype=float)
+        if frames.ndim != 2:
+            raise ValueError("estimate_freq_batch expects a 2-D (n_frames, frame_len) array")
+        frame_len = frames.shape[1]
+        half = frame_len // 2
+
+        X = np.fft.rfft(frames, axis=-1)
+        mag2 = X.real * X.real + X.imag * X.imag
+
+        k = np.argmax(mag2[:, :half], axis=-1)
+        rows = np.arange(frames.shape[0])
+
+        # Parabolic interpolation only where the peak has two neighbors;
+        # sqrt just the three bins per row that the fit actually uses.
+        interior = (k >= 1) & (k < half - 1)
+        k_safe = np.clip(k, 1, half - 2)
+        left = np.sqrt(mag2[rows, k_safe - 1])
+        mid = np.sqrt(mag2[rows, k_safe])
+        right = np.sqrt(mag2[rows, k_safe + 1])
+        denom = left - 2.0 * mid + right
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = np.where(denom != 0.0, 0.5 * (left - right) / denom, 0.0)
+        delta = np.where(interior, delta, 0.0)
+
+        freqs: NDArray[np.float64] = (k + delta) * float(fs) / float(frame_len)
+        return freqs
+
+    def _update_multi(self, measures: PMU_Input) -> float:
+        """Multi-channel branch of ``update``: mirror-write all channels,
+        reseed or advance the batched sliding DFT, and return the primary
+        channel's estimate (per-channel results land in ``channel_freqs``)."""
+        xs = np.array(self._mc_get(measures), dtype=float)
+        ptr = self.ptr
+        xs_old = self._mc_buffer[:, ptr].copy()
+        self._mc_buffer[:, ptr] = xs
+        self._mc_buffer[:, ptr + self.frame_len] = xs
+        ptr += 1
+        if ptr == self.frame_len:
+            ptr = 0
+            self.filled = True
+        self.ptr = ptr
+
+        if self.filled:
+            if not self._synced or self._since_refresh >= self._refresh_every:
+                self._refresh_bins_multi()
+            else:
+                self._mc_X3 = self._mc_tw * (self._mc_X3 + (xs - xs_old)[:, None])
+                self._since_refresh += 1
+            freqs = self._estimate_freq_multi()
+        else:
+            freqs = np.full(len(self.channels), self.nominal_hz)
+        self.channel_freqs = freqs
+        return float(freqs[self._primary_idx])
 
     def update(self, measures: PMU_Input) -> PMU_Output:
-        # time & sample
+        # time & sample (prebound attrgetter: no per-sample getattr dispatch)
         ts: float = float(measures.timestamp)
-        x: float = float(getattr(measures, self.channel, 0.0))
 
-        # slide buffer
-        self.buffer[self.ptr] = x
-        self.ptr = (self.ptr + 1) % self.frame_len
-        if not self.filled and self.ptr == 0:
-            self.filled = True
+        if self._multi:
+            f_hat: float = self._update_multi(measures)
+        else:
+            x = float(self._chan_get(measures))
+
+            # mirror write; the overwritten value feeds the sliding-DFT
+            # recurrence
+            ptr = self.ptr
+            x_old: float = float(self.buffer[ptr])
+            self.buffer[ptr] = x
+            self.buffer[ptr + self.frame_len] = x
+            ptr += 1
+            if ptr == self.frame_len:
+                ptr = 0
+                self.filled = True
+            self.ptr = ptr
 
-        # frequency estimate (use nominal until buffer fills)
-        f_hat: float = self._estimate_freq() if self.filled else self.nominal_hz
+            # frequency estimate (use nominal until buffer fills)
+            if self.filled:
+                if not self._synced or self._since_refresh >= self._refresh_every:
+                    # Full rfft only every frame_len//4 samples to re-anchor
+                    # the peak bin; between refreshes each sample costs 3
+                    # complex multiplies instead of an O(N log N) transform.
+                    self._refresh_bins()
+                else:
+                    self._X3 = self._tw * (self._X3 + (x - x_old))
+                    self._since_refresh += 1
+                f_hat = self._estimate_freq()
+            else:
+                f_hat = self.nominal_hz
 
         # rocof (finite difference when we have a previous estimate with Δt > 0)
         if self._last_freq is not None and self._last_ts is not None:
@@ -98,16 +494,22 @@ class IpDFT(EstimatorBase):
         self._last_freq = f_hat
         self._last_ts = ts
 
-        # phasor placeholders — standard keys to satisfy Literal typings
+        # phasor placeholders — one attrgetter call for all six channels
+        vals = _PHASORS_GET(measures)
         phasors: dict[PhasorName, complex] = {
-            "V1": complex(float(getattr(measures, "V1", 0.0)), 0.0),
-            "V2": complex(float(getattr(measures, "V2", 0.0)), 0.0),
-            "V3": complex(float(getattr(measures, "V3", 0.0)), 0.0),
-            "I1": complex(float(getattr(measures, "I1", 0.0)), 0.0),
-            "I2": complex(float(getattr(measures, "I2", 0.0)), 0.0),
-            "I3": complex(float(getattr(measures, "I3", 0.0)), 0.0),
+            k: complex(float(v), 0.0) for k, v in zip(_PHASOR_KEYS, vals, strict=True)
         }
 
+        # record into the SoA ring for block-oriented consumers
+        i = self._ring_i
+        self._ts_ring[i] = ts
+        self._f_ring[i] = f_hat
+        self._r_ring[i] = r_hat
+        self._ph_ring[i] = vals
+        self._ring_i = (i + 1) % self._ring_len
+        if self._ring_n < self._ring_len:
+            self._ring_n += 1
+
         return PMU_Output(
             timestamp_utc=ts,
             frequency_hz=f_hat,
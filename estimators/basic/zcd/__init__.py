@@ -1,4 +1,6 @@
 # estimators/basic/zcd/__init__.py
-from .single import ZCDSingle  # adjust if your class is named differently
+from .distributed import DistributedZCD
+from .multi import ZCDMulti
+from .single import ZCDSingle
 
-__all__ = ["ZCDSingle"]
+__all__ = ["ZCDSingle", "ZCDMulti", "DistributedZCD"]
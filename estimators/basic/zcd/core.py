@@ -8,44 +8,69 @@ from __future__ import annotations
 #   - estimators/zcd/distributed.py  (multi-node/distributed)
 #
 # Provides:
-#   - ZCDConfig: configuration dataclass
-#   - ZCDState:  minimal streaming state
+#   - ZCDConfig: configuration (plain __slots__ class)
 #   - detect_crossing(): robust linear-interp crossing detector
 #   - ZCDEstimatorBase: base with update_scalar(value, ts)
 #
-# Dependencies: stdlib only.
+# Dependencies: numpy; numba is optional (install extra: "signal") and
+# JIT-compiles the per-sample kernel when present.
 # ---------------------------------------------------------------------
 
 import math
-from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:  # optional accelerator; pure-Python fallback below works without it
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
 
 # --------------------------- Config & State ---------------------------
 
 CrossingMode = Literal["neg_to_pos", "pos_to_neg", "either"]
 
 
-@dataclass(slots=True)
 class ZCDConfig:
-    """Runtime knobs for ZCD."""
-
-    epsilon: float = 0.0  # deadband around zero
-    nominal_hz: float = 60.0  # fallback when no crossings yet
-    mode: CrossingMode = "neg_to_pos"  # which crossing to detect
-    min_period_s: float = 1e-6  # ignore absurdly small periods
-    max_period_s: float = 1.0  # ignore absurdly large periods (outliers)
-
-
-@dataclass(slots=True)
-class ZCDState:
-    """Streaming state across samples."""
-
-    prev_val: float | None = None
-    prev_ts: float | None = None
-    last_cross_ts: float | None = None
-    prev_cross_ts: float | None = None
-    last_freq: float | None = None
-    prev_freq: float | None = None
+    """Runtime knobs for ZCD (plain __slots__ class: no dataclass machinery
+    on the construction path, same attribute layout)."""
+
+    __slots__ = ("epsilon", "nominal_hz", "mode", "min_period_s", "max_period_s")
+
+    def __init__(
+        self,
+        epsilon: float = 0.0,
+        nominal_hz: float = 60.0,
+        mode: CrossingMode = "neg_to_pos",
+        min_period_s: float = 1e-6,
+        max_period_s: float = 1.0,
+    ) -> None:
+        self.epsilon = epsilon  # deadband around zero
+        self.nominal_hz = nominal_hz  # fallback when no crossings yet
+        self.mode = mode  # which crossing to detect
+        self.min_period_s = min_period_s  # ignore absurdly small periods
+        self.max_period_s = max_period_s  # ignore absurdly large periods (outliers)
+
+
+# Streaming state lives in a length-8 float64 vector (NaN = unset) so the
+# per-sample kernel can be JIT-compiled; index layout:
+#   0: prev_val, 1: prev_ts, 2: last_cross_ts,
+#   3: prev_cross_ts, 4: last_freq, 5: prev_freq,
+#   6: crossed flag for the last step (0.0/1.0), 7: last t_cross
+# Slots 6-7 are per-step outputs written in place so the scalar kernel
+# returns a bare float instead of boxing a result tuple every sample.
+# The batched kernel only touches slots 0-5 and reports its outputs as
+# arrays.
+_STATE_LEN = 8
+
+_MODE_CODES: dict[str, int] = {"neg_to_pos": 0, "pos_to_neg": 1, "either": 2}
+
+
+def _normalize_mode(value: Any, default: CrossingMode = "neg_to_pos") -> CrossingMode:
+    """Coerce an arbitrary config value to a valid crossing-mode literal."""
+    s = str(value) if value is not None else ""
+    return cast("CrossingMode", s if s in _MODE_CODES else default)
 
 
 # ------------------------- Core functionality -------------------------
@@ -78,16 +103,20 @@ def detect_crossing(
         crossed: whether a crossing occurred between prev and curr
         t_cross: interpolated crossing timestamp (seconds) if crossed, else None
     """
-    s0 = _sign(prev_val, eps)
-    s1 = _sign(curr_val, eps)
-
-    if mode == "neg_to_pos":
-        crossed = (s0 == -1) and (s1 >= 0)
-    elif mode == "pos_to_neg":
-        crossed = (s0 == 1) and (s1 <= 0)
-    else:  # "either"
-        # merged comparison per Ruff PLR1714
-        crossed = (s0 != 0) and (s1 not in {0, s0})
+    # Four comparisons replace the two branchy _sign() calls; each mode
+    # reduces to an and/not combination of the deadband predicates.
+    p0 = prev_val > eps
+    n0 = prev_val < -eps
+    p1 = curr_val > eps
+    n1 = curr_val < -eps
+
+    mode_code = _MODE_CODES.get(mode, 0)
+    if mode_code == 0:  # neg_to_pos: s0 == -1 and s1 >= 0
+        crossed = n0 and not n1
+    elif mode_code == 1:  # pos_to_neg: s0 == +1 and s1 <= 0
+        crossed = p0 and not p1
+    else:  # either: both nonzero, opposite signs
+        crossed = (p0 or n0) and (p1 or n1) and (p0 != p1)
 
     if not crossed:
         return False, None
@@ -103,6 +132,81 @@ def detect_crossing(
     return True, float(t_cross)
 
 
+def _zcd_step(
+    state: NDArray[np.float64],
+    value: float,
+    ts: float,
+    eps: float,
+    mode_code: int,
+    min_p: float,
+    max_p: float,
+) -> float:
+    """
+    Per-sample ZCD transition on a length-8 state vector (see _STATE_LEN).
+
+    Pure scalar float arithmetic on purpose: numba JIT-compiles this body
+    when installed; otherwise it runs as plain Python with no numpy-dispatch
+    overhead. NaN is the "unset" sentinel (``math.isnan`` tests; numba
+    supports it natively).
+
+    Returns the RoCoF; the frequency is read back from ``state[4]`` and the
+    per-step crossing flag / interpolated instant from ``state[6]`` /
+    ``state[7]``, so no result tuple is allocated on the hot path.
+    """
+    crossed = False
+    t_cross = math.nan
+
+    prev_val = state[0]
+    prev_ts = state[1]
+    if not math.isnan(prev_val):  # have a previous sample
+        # Branchless crossing predicate: the deadband comparisons are
+        # materialized as bools and combined with bitwise ops (no
+        # short-circuit jumps), then the mode dispatch selects one of the
+        # three candidates arithmetically. Near zero the sign of a noisy
+        # signal is essentially random, so data-dependent branches here
+        # mispredict badly; comparison results compile to flag/setcc code
+        # under numba instead.
+        p0 = prev_val > eps
+        n0 = prev_val < -eps
+        p1 = value > eps
+        n1 = value < -eps
+        c_np = n0 & (not n1)  # neg_to_pos: s0 == -1 and s1 >= 0
+        c_pn = p0 & (not p1)  # pos_to_neg: s0 == +1 and s1 <= 0
+        c_ei = (p0 | n0) & (p1 | n1) & (p0 ^ p1)  # either: strict sign flip
+        crossed = ((mode_code == 0) & c_np) | ((mode_code == 1) & c_pn) | ((mode_code == 2) & c_ei)
+
+        if crossed:
+            dx = value - prev_val
+            t_cross = ts if dx == 0.0 else prev_ts + (ts - prev_ts) * (-prev_val) / dx
+            last_cross = state[2]
+            if not math.isnan(last_cross):
+                period = t_cross - last_cross
+                if min_p <= period <= max_p:
+                    state[5] = state[4]
+                    state[4] = 1.0 / period
+                    state[3] = state[2]
+                    state[2] = t_cross
+            else:  # first observed crossing
+                state[2] = t_cross
+
+    state[0] = value
+    state[1] = ts
+    state[6] = 1.0 if crossed else 0.0
+    state[7] = t_cross
+
+    rocof = 0.0
+    if not (math.isnan(state[4]) or math.isnan(state[5])):
+        dt = state[2] - state[3]
+        if not math.isnan(dt) and dt > 0.0:
+            rocof = (state[4] - state[5]) / dt
+
+    return rocof
+
+
+if njit is not None:  # pragma: no cover - depends on environment
+    _zcd_step = njit(cache=True, fastmath=True)(_zcd_step)
+
+
 class ZCDEstimatorBase:
     """
     Minimal helper you can mix into an EstimatorBase subclass.
@@ -118,10 +222,11 @@ class ZCDEstimatorBase:
 
     def __init__(self, cfg: ZCDConfig | None = None) -> None:
         self.cfg: ZCDConfig = cfg or ZCDConfig()
-        self.state: ZCDState = ZCDState()
+        self._state: NDArray[np.float64] = np.full(_STATE_LEN, np.nan, dtype=np.float64)
+        self._mode_code: int = _MODE_CODES.get(self.cfg.mode, 0)
 
     def reset(self) -> None:
-        self.state = ZCDState()
+        self._state.fill(np.nan)
 
     # Core streaming update
     def update_scalar(self, value: float, ts: float) -> tuple[float, float, bool, float | None]:
@@ -132,50 +237,209 @@ class ZCDEstimatorBase:
         -------
         (freq_hz, rocof_hz_s, crossed, t_cross)
         """
-        st = self.state
         cfg = self.cfg
+        state = self._state
+        rocof = _zcd_step(
+            state,
+            float(value),
+            float(ts),
+            cfg.epsilon,
+            self._mode_code,
+            cfg.min_period_s,
+            cfg.max_period_s,
+        )
+        freq = state[4]
+        if math.isnan(freq):  # no valid crossing pair yet -> nominal
+            freq = cfg.nominal_hz
+        t_cross = state[7]
+        tc: float | None = None if math.isnan(t_cross) else float(t_cross)
+        return float(freq), float(rocof), bool(state[6]), tc
+
+
+# --------------------------- Batched kernel ---------------------------
+
+
+def _sign_i8(x: NDArray[np.float64], eps: float) -> NDArray[np.int8]:
+    """Branchless deadband sign: -1/0/+1 as int8, SIMD-friendly.
+
+    ``np.sign`` covers the eps == 0 case directly; with a deadband the two
+    comparisons produce boolean lanes that subtract into the ternary sign
+    without any data-dependent branching.
+    """
+    if eps == 0.0:
+        return np.sign(x).astype(np.int8)
+    return (x > eps).astype(np.int8) - (x < -eps).astype(np.int8)
+
+
+def _zcd_step_batch(
+    states: NDArray[np.float64],
+    values: NDArray[np.float64],
+    ts: float,
+    eps: float,
+    mode_code: int,
+    min_p: float,
+    max_p: float,
+) -> tuple[
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.bool_],
+    NDArray[np.float64],
+]:
+    """
+    One synchronous ZCD step for a bank of independent detectors (SoA form).
 
-        crossed = False
-        t_cross: float | None = None
+    ``states`` is an (n, _STATE_LEN) float64 array — one row per detector,
+    same index layout and NaN sentinels as the scalar ``_zcd_step`` — updated
+    in place with masked NumPy ops instead of n Python-level calls.
 
-        if st.prev_val is not None and st.prev_ts is not None:
-            crossed, t_cross = detect_crossing(
-                st.prev_val, st.prev_ts, value, ts, eps=cfg.epsilon, mode=cfg.mode
-            )
-            if crossed:
-                if st.last_cross_ts is not None and t_cross is not None:
-                    period = float(t_cross - st.last_cross_ts)
-                    # Filter absurd periods:
-                    if cfg.min_period_s <= period <= cfg.max_period_s:
-                        freq = 1.0 / period
-                        st.prev_freq = st.last_freq
-                        st.last_freq = freq
-                        st.prev_cross_ts = st.last_cross_ts
-                        st.last_cross_ts = t_cross
-                else:
-                    # first observed crossing
-                    st.last_cross_ts = t_cross
-
-        # advance sample history
-        st.prev_val = float(value)
-        st.prev_ts = float(ts)
-
-        # frequency: last known or nominal
-        freq_hz = float(st.last_freq) if st.last_freq is not None else float(cfg.nominal_hz)
-
-        # rocof via consecutive crossing-based freqs
-        rocof_hz_s = 0.0
-        if (
-            st.last_freq is not None
-            and st.prev_freq is not None
-            and st.last_cross_ts is not None
-            and st.prev_cross_ts is not None
-        ):
-            dt = float(st.last_cross_ts - st.prev_cross_ts)
-            if dt > 0.0:
-                rocof_hz_s = float((st.last_freq - st.prev_freq) / dt)
-
-        return freq_hz, rocof_hz_s, crossed, t_cross
+    Returns
+    -------
+    (freq_hz, rocof_hz_s, crossed, t_cross)
+        Arrays of shape (n,); ``freq_hz`` is NaN where no valid period has
+        been observed yet, ``t_cross`` is NaN where no crossing occurred.
+    """
+    pv = states[:, 0].copy()
+    pt = states[:, 1].copy()
+    has_prev = ~np.isnan(pv)
+
+    # nan_to_num keeps the int8 cast well-defined for unset rows; those are
+    # excluded by the has_prev mask anyway.
+    s0 = _sign_i8(np.nan_to_num(pv), eps)
+    s1 = _sign_i8(values, eps)
+    if mode_code == 0:  # neg_to_pos
+        crossed = (s0 == -1) & (s1 >= 0)
+    elif mode_code == 1:  # pos_to_neg
+        crossed = (s0 == 1) & (s1 <= 0)
+    else:  # either
+        crossed = (s0 != 0) & (s1 != 0) & (s1 != s0)
+    crossed &= has_prev
+
+    dx = values - pv
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_cross = np.where(dx != 0.0, pt + (ts - pt) * (-pv) / np.where(dx == 0.0, 1.0, dx), ts)
+
+    first = crossed & np.isnan(states[:, 2])
+    rest = crossed & ~first
+    states[first, 2] = t_cross[first]
+
+    period = t_cross - states[:, 2]
+    valid = rest & (period >= min_p) & (period <= max_p)
+    states[valid, 5] = states[valid, 4]
+    states[valid, 4] = 1.0 / period[valid]
+    states[valid, 3] = states[valid, 2]
+    states[valid, 2] = t_cross[valid]
+
+    states[:, 0] = values
+    states[:, 1] = ts
+
+    freq = states[:, 4]
+    both = ~np.isnan(freq) & ~np.isnan(states[:, 5])
+    dt = states[:, 2] - states[:, 3]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rocof = np.where(both & (dt > 0.0), (freq - states[:, 5]) / dt, 0.0)
+
+    t_cross_out = np.where(crossed, t_cross, np.nan)
+    return freq.copy(), rocof, crossed, t_cross_out
+
+
+def zcd_batch(
+    x: NDArray[np.float64],
+    ts: NDArray[np.float64],
+    cfg: ZCDConfig | None = None,
+) -> tuple[
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.bool_],
+    NDArray[np.float64],
+]:
+    """
+    Vectorized ZCD over a whole trace (offline / pipeline path).
+
+    All crossings are detected in one NumPy pass: sign classification with
+    deadband, boolean crossing mask, vectorized linear interpolation of the
+    crossing instants, then reciprocal periods for frequency. Per-sample
+    traces are reconstructed by carrying the last valid estimate forward via
+    ``np.searchsorted`` on the crossing times.
+
+    Parameters
+    ----------
+    x, ts : NDArray[np.float64]
+        Samples and their timestamps (seconds), same 1-D length.
+    cfg : ZCDConfig | None
+        Same knobs as the streaming path (deadband, mode, period filter).
+
+    Returns
+    -------
+    (freq_hz, rocof_hz_s, crossed, t_cross)
+        Per-sample arrays of length ``len(x)``. ``freq_hz`` holds the nominal
+        frequency before the first full period; ``t_cross`` is NaN except at
+        samples where a crossing was detected.
+
+    Notes
+    -----
+    Periods outside ``[min_period_s, max_period_s]`` are dropped before the
+    frequency reconstruction, which can differ marginally from the streaming
+    update (where an absurd period also freezes the crossing anchor).
+    Estimate visibility is anchored at the detection sample index, so the
+    per-sample trace matches the streaming path even when a deadband makes
+    the interpolated crossing instant extrapolate past that sample's
+    timestamp.
+    """
+    cfg = cfg or ZCDConfig()
+    x = np.asarray(x, dtype=np.float64)
+    ts = np.asarray(ts, dtype=np.float64)
+    n = x.shape[0]
+
+    eps = cfg.epsilon
+    s = _sign_i8(x, eps)
+    s0, s1 = s[:-1], s[1:]
+    mode_code = _MODE_CODES.get(cfg.mode, 0)
+    if mode_code == 0:  # neg_to_pos
+        mask = (s0 == -1) & (s1 >= 0)
+    elif mode_code == 1:  # pos_to_neg
+        mask = (s0 == 1) & (s1 <= 0)
+    else:  # either
+        mask = (s0 != 0) & (s1 != 0) & (s1 != s0)
+
+    idx = np.flatnonzero(mask)  # crossing between idx and idx+1
+    x0, x1 = x[idx], x[idx + 1]
+    dx = x1 - x0
+    # Degenerate dx == 0 falls back to the current timestamp (alpha = 1).
+    alpha = np.where(dx != 0.0, -x0 / np.where(dx == 0.0, 1.0, dx), 1.0)
+    t_cross = ts[idx] + (ts[idx + 1] - ts[idx]) * alpha
+
+    periods = np.diff(t_cross)
+    valid = (periods >= cfg.min_period_s) & (periods <= cfg.max_period_s)
+    freq_at = 1.0 / periods[valid]
+    t_at = t_cross[1:][valid]  # crossing instants (RoCoF denominators)
+
+    # Carry the last known frequency forward onto the sample grid, anchored
+    # at the detection sample (idx + 1) like the streaming path. With a
+    # deadband the interpolated t_cross can extrapolate past the detection
+    # sample's timestamp (|prev_val| > eps gives alpha > 1), so a timestamp
+    # search would make the new estimate visible one sample late there.
+    sample_i = np.arange(n)
+    if freq_at.size:
+        vis = idx[1:][valid] + 1  # first sample index where each freq is known
+        cnt = np.searchsorted(vis, sample_i, side="right")
+        freq_hz = np.where(cnt > 0, freq_at[np.maximum(cnt - 1, 0)], cfg.nominal_hz)
+    else:
+        freq_hz = np.full(n, cfg.nominal_hz, dtype=np.float64)
+
+    # RoCoF from consecutive crossing-based frequencies, same carry-forward.
+    rocof_hz_s = np.zeros(n, dtype=np.float64)
+    if freq_at.size >= 2:
+        dt_at = np.diff(t_at)
+        rocof_at = np.diff(freq_at) / dt_at
+        cnt_r = np.searchsorted(vis[1:], sample_i, side="right")
+        rocof_hz_s = np.where(cnt_r > 0, rocof_at[np.maximum(cnt_r - 1, 0)], 0.0)
+
+    crossed = np.zeros(n, dtype=bool)
+    crossed[idx + 1] = True
+    t_cross_full = np.full(n, np.nan, dtype=np.float64)
+    t_cross_full[idx + 1] = t_cross
+
+    return freq_hz, rocof_hz_s, crossed, t_cross_full
 
 
 # ------------------------ Tiny local smoke test -----------------------
@@ -191,12 +455,17 @@ class ZCDCoreTester:
         self, fs: float = 10_000.0, f: float = 60.0, seconds: float = 0.2
     ) -> list[tuple[float, float, float, float, bool, float | None]]:
         n = int(fs * seconds)
-        dt = 1.0 / fs
-        t0 = 0.0
-        out: list[tuple[float, float, float, float, bool, float | None]] = []
-        for k in range(n):
-            t = t0 + k * dt
-            x = math.sin(2.0 * math.pi * f * t)
-            freq, rocof, crossed, t_cross = self.core.update_scalar(x, t)
-            out.append((t, x, freq, rocof, crossed, t_cross))
-        return out
+        t = np.arange(n, dtype=np.float64) / fs
+        x = np.sin(2.0 * np.pi * f * t)
+        freq, rocof, crossed, t_cross = zcd_batch(x, t, self.core.cfg)
+        return [
+            (
+                float(t[k]),
+                float(x[k]),
+                float(freq[k]),
+                float(rocof[k]),
+                bool(crossed[k]),
+                None if math.isnan(t_cross[k]) else float(t_cross[k]),
+            )
+            for k in range(n)
+        ]
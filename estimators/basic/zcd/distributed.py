@@ -14,7 +14,10 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from estimators.zcd.core import ZCDConfig, ZCDEstimatorBase
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from .core import _MODE_CODES, _STATE_LEN, _normalize_mode, _zcd_step_batch, ZCDConfig
 
 
 def metropolis_weights(adj: Mapping[str, list[str]]) -> dict[tuple[str, str], float]:
@@ -34,6 +37,63 @@ def metropolis_weights(adj: Mapping[str, list[str]]) -> dict[tuple[str, str], fl
     return W
 
 
+def metropolis_weight_matrix(adj: Mapping[str, list[str]], order: list[str]) -> csr_matrix:
+    """
+    Vectorized Metropolis-Hastings weight matrix over a fixed node order.
+
+    Builds a boolean adjacency matrix, then computes all off-diagonal
+    weights as ``1 / (1 + max(deg_i, deg_j))`` with a single broadcast and
+    sets the diagonal to the row-sum complement — a handful of NumPy kernels
+    instead of per-edge Python dict inserts. Neighbors not present in
+    ``order`` are ignored.
+    """
+    idx = {n: i for i, n in enumerate(order)}
+    n = len(order)
+    A = np.zeros((n, n), dtype=bool)
+    for i, neigh in adj.items():
+        ii = idx.get(i)
+        if ii is None:
+            continue
+        cols = [idx[j] for j in neigh if j in idx]
+        A[ii, cols] = True
+    np.fill_diagonal(A, False)
+
+    deg = np.maximum(1, A.sum(axis=1))
+    m = 1.0 / (1.0 + np.maximum(deg[:, None], deg[None, :]))
+    W = np.where(A, m, 0.0)
+    np.fill_diagonal(W, np.maximum(0.0, 1.0 - W.sum(axis=1)))
+    return csr_matrix(W)
+
+
+def _dist_step(
+    states: np.ndarray,
+    values: np.ndarray,
+    ts: float,
+    cfg: ZCDConfig,
+    mode_code: int,
+    W_csr: csr_matrix | None,
+    alpha: float,
+) -> tuple[np.ndarray, np.ndarray, float, float, np.ndarray | None]:
+    """
+    One fused numeric step: batched per-node ZCD update, nominal fill-in,
+    both mean reductions and (when a graph is present) the Metropolis SpMV —
+    a single pass over the SoA state instead of separate dict-shaped stages.
+
+    Returns ``(freq, rocof, mean_f, mean_r, fused)`` where ``fused`` is the
+    post-consensus frequency vector or None without a weight matrix.
+    """
+    freq, rocof, _crossed, _tc = _zcd_step_batch(
+        states, values, ts, cfg.epsilon, mode_code, cfg.min_period_s, cfg.max_period_s
+    )
+    freq = np.where(np.isnan(freq), cfg.nominal_hz, freq)
+    mean_f = float(freq.mean()) if freq.size else 0.0
+    mean_r = float(rocof.mean()) if rocof.size else 0.0
+    fused = None
+    if W_csr is not None:
+        fused = (1.0 - alpha) * freq + alpha * (W_csr @ freq)
+    return freq, rocof, mean_f, mean_r, fused
+
+
 class DistributedZCD:
     """
     Distributed ZCD manager.
@@ -52,18 +112,24 @@ class DistributedZCD:
 
         eps = float(config.get("epsilon", 0.0))
         nominal = float(config.get("nominal_hz", 60.0))
-        mode = str(config.get("mode", "neg_to_pos"))
+        mode = _normalize_mode(config.get("mode", "neg_to_pos"))
 
-        self.cores: dict[str, ZCDEstimatorBase] = {
-            n: ZCDEstimatorBase(ZCDConfig(epsilon=eps, nominal_hz=nominal, mode=mode))
-            for n in self.nodes
-        }
+        # Per-node detector state as one (N, 6) SoA array driven by the
+        # vectorized kernel — one NumPy pass per step instead of N Python
+        # calls into per-node core objects.
+        self.cfg: ZCDConfig = ZCDConfig(epsilon=eps, nominal_hz=nominal, mode=mode)
+        self._mode_code: int = _MODE_CODES.get(self.cfg.mode, 0)
+        self._states: np.ndarray = np.full((len(self.nodes), _STATE_LEN), np.nan, dtype=np.float64)
 
         self.adj: dict[str, list[str]] = {
             n: list(config.get("adjacency", {}).get(n, [])) for n in self.nodes
         }
-        self.W: dict[tuple[str, str], float] = (
-            metropolis_weights(self.adj) if any(self.adj.values()) else {}
+        # Fixed node ordering + CSR weight matrix so the consensus step is a
+        # single SpMV instead of nested Python loops over dict lookups.
+        self._idx: dict[str, int] = {n: i for i, n in enumerate(self.nodes)}
+        self._node_order: tuple[str, ...] = tuple(self.nodes)
+        self._W_csr: csr_matrix | None = (
+            metropolis_weight_matrix(self.adj, self.nodes) if any(self.adj.values()) else None
         )
         self.fuse_mode: str = str(config.get("fuse", "consensus"))
         self.alpha: float = float(config.get("consensus_alpha", 1.0))  # 1 MH step by default
@@ -73,25 +139,22 @@ class DistributedZCD:
         self.last_fused_rocof: float | None = None
 
     def reset(self) -> None:
-        for core in self.cores.values():
-            core.reset()
+        self._states.fill(np.nan)
         self.last_fused_freq = None
         self.last_fused_rocof = None
 
     def _fuse_consensus(self, local_f: Mapping[str, float]) -> dict[str, float]:
-        if not self.W:
+        if self._W_csr is None:
             # No graph → fall back to mean
             m = sum(local_f.values()) / max(1, len(local_f))
             return {n: float(m) for n in local_f}
 
-        new_f: dict[str, float] = {}
-        for i in local_f:
-            acc = self.W.get((i, i), 0.0) * local_f[i]
-            for j in self.adj.get(i, []):
-                acc += self.W.get((i, j), 0.0) * local_f.get(j, local_f[i])
-            # one step (or blend via alpha)
-            new_f[i] = float((1.0 - self.alpha) * local_f[i] + self.alpha * acc)
-        return new_f
+        # One Metropolis step as a sparse matrix-vector product.
+        f_vec = np.fromiter(
+            (local_f[n] for n in self.nodes), dtype=np.float64, count=len(self.nodes)
+        )
+        new = (1.0 - self.alpha) * f_vec + self.alpha * (self._W_csr @ f_vec)
+        return dict(zip(self.nodes, new.tolist(), strict=True))
 
     def step(self, sample: Mapping[str, Any]) -> dict[str, Any]:
         """
@@ -118,29 +181,41 @@ class DistributedZCD:
         ts = float(sample["timestamp"])
         nodes_payload = sample["nodes"]  # Mapping[str, Mapping[str, Any]]
 
-        # 1) local ZCD updates
-        local_freq: dict[str, float] = {}
-        local_rocof: dict[str, float] = {}
-        for n, core in self.cores.items():
-            v = float(nodes_payload.get(n, {}).get("value", 0.0))
-            f, r, _crossed, _tc = core.update_scalar(v, ts)
-            local_freq[n] = f
-            local_rocof[n] = r
+        # one pass over the payload to form the input vector, then the
+        # vector fast path below
+        values = np.fromiter(
+            (nodes_payload.get(n, {}).get("value", 0.0) for n in self._node_order),
+            dtype=np.float64,
+            count=len(self._node_order),
+        )
+        return self.step_vec(ts, values)
 
-        # 2) fusion
-        mean_f = sum(local_freq.values()) / max(1, len(local_freq))
-        mean_r = sum(local_rocof.values()) / max(1, len(local_rocof))
+    def step_vec(self, ts: float, values: np.ndarray) -> dict[str, Any]:
+        """
+        Vector fast path: update with one value per node, in ``self.nodes``
+        order, skipping the per-node payload dict parsing of ``step``.
+        """
+        # single fused numeric pass: local updates + reductions + SpMV
+        freq_arr, rocof_arr, mean_f, mean_r, fused_vec = _dist_step(
+            self._states, values, ts, self.cfg, self._mode_code, self._W_csr, self.alpha
+        )
+        local_freq = freq_arr.tolist()
+        local_rocof = rocof_arr.tolist()
 
         fused: dict[str, Any] = {
-            "mean_freq_hz": float(mean_f),
-            "mean_rocof_hz_s": float(mean_r),
+            "mean_freq_hz": mean_f,
+            "mean_rocof_hz_s": mean_r,
         }
 
         if self.fuse_mode == "consensus":
-            fused_freq = self._fuse_consensus(local_freq)
+            if fused_vec is None:
+                # No graph → fall back to the mean for every node
+                fused_freq = {n: mean_f for n in self.nodes}
+                self.last_fused_freq = mean_f
+            else:
+                fused_freq = dict(zip(self.nodes, fused_vec.tolist(), strict=True))
+                self.last_fused_freq = float(fused_vec.mean())
             fused["consensus_freq_hz"] = fused_freq
-            # store an overall average as headline
-            self.last_fused_freq = sum(fused_freq.values()) / max(1, len(fused_freq))
             self.last_fused_rocof = mean_r  # RoCoF fusion kept as mean for simplicity
         else:
             self.last_fused_freq = mean_f
@@ -149,7 +224,8 @@ class DistributedZCD:
         return {
             "timestamp": ts,
             "local": {
-                n: {"freq_hz": local_freq[n], "rocof_hz_s": local_rocof[n]} for n in self.nodes
+                n: {"freq_hz": local_freq[i], "rocof_hz_s": local_rocof[i]}
+                for i, n in enumerate(self.nodes)
             },
             "fused": fused,
         }
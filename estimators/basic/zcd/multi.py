@@ -6,25 +6,56 @@
 
 from __future__ import annotations
 
+import math
+import operator
+from types import MappingProxyType
 from typing import Any, Literal
 
+import numpy as np
+
 from estimators.base import EstimatorBase
-from estimators.zcd.core import ZCDConfig, ZCDEstimatorBase
 from utils.pmu.pmu_input import PMU_Input
 from utils.pmu.pmu_output import PMU_Output, PhasorName, PhasorMap
 
+from .core import _MODE_CODES, _STATE_LEN, _normalize_mode, _zcd_step, _zcd_step_batch, ZCDConfig
+
+__all__ = ["ZCDMulti"]
+
+# Shared immutable placeholder: ZCD computes no phasors, so by default every
+# update returns this instead of allocating a dict of complex() per sample.
+_EMPTY_PHASORS: PhasorMap = MappingProxyType({})
+
+# Channel whitelist hoisted to module scope (tuple for ordered docs/repr,
+# frozenset for the O(1) membership test in the constructor filter).
+_VALID_CHANNELS: tuple[PhasorName, ...] = ("V1", "V2", "V3", "I1", "I2", "I3")
+_VALID_CHANNELS_SET = frozenset(_VALID_CHANNELS)
+
+
+def _median3(a: float, b: float, c: float) -> float:
+    """Median of three via a short comparison network (no sort, no alloc)."""
+    if a <= b <= c or c <= b <= a:
+        return b
+    if b <= a <= c or c <= a <= b:
+        return a
+    return c
+
 
 def _agg(vals: list[float], mode: Literal["median", "mean"]) -> float:
-    if not vals:
+    n = len(vals)
+    if not n:
         return 0.0
+    if n == 3:
+        # The common 3-phase case: no sort, no list allocation.
+        a, b, c = vals
+        if mode == "mean":
+            return (a + b + c) / 3.0
+        return _median3(a, b, c)
     if mode == "mean":
-        return float(sum(vals) / len(vals))
-    # default: median
-    vals_sorted = sorted(vals)
-    m = len(vals_sorted) // 2
-    return float(
-        vals_sorted[m] if len(vals_sorted) % 2 else (vals_sorted[m - 1] + vals_sorted[m]) / 2
-    )
+        return float(sum(vals) / n)
+    # default: median via partial selection instead of a full sort
+    m = n // 2
+    part = np.partition(np.asarray(vals, dtype=np.float64), m)
+    return float(part[m] if n % 2 else (np.max(part[:m]) + part[m]) / 2.0)
 
 
 class ZCDMulti(EstimatorBase):
@@ -53,9 +84,8 @@ class ZCDMulti(EstimatorBase):
             )
 
         # Filtra al conjunto permitido para satisfacer PhasorName
-        valid: tuple[PhasorName, ...] = ("V1", "V2", "V3", "I1", "I2", "I3")
         cfg_channels = list(g("channels", ["V1", "V2", "V3"]))
-        self.channels: list[PhasorName] = [c for c in cfg_channels if c in valid] or [
+        self.channels: list[PhasorName] = [c for c in cfg_channels if c in _VALID_CHANNELS_SET] or [
             "V1",
             "V2",
             "V3",
@@ -63,44 +93,108 @@ class ZCDMulti(EstimatorBase):
 
         eps = float(g("epsilon", 0.0))
         nominal = float(g("nominal_hz", 60.0))
-        mode = str(g("mode", "neg_to_pos"))
+        mode = _normalize_mode(g("mode", "neg_to_pos"))
         self.agg_mode: Literal["median", "mean"] = g("agg", "median")
-
-        self.cores: dict[PhasorName, ZCDEstimatorBase] = {
-            ch: ZCDEstimatorBase(ZCDConfig(epsilon=eps, nominal_hz=nominal, mode=mode))
-            for ch in self.channels
-        }
+        self.emit_phasors: bool = bool(g("emit_phasors", False))
+
+        # SoA detector state: one (n_channels, 6) array driven by the
+        # vectorized kernel, instead of a dict of per-phase core objects
+        # (pointer chasing + one Python call per phase per sample).
+        self.cfg: ZCDConfig = ZCDConfig(epsilon=eps, nominal_hz=nominal, mode=mode)
+        self._mode_code: int = _MODE_CODES.get(self.cfg.mode, 0)
+        self._states: np.ndarray = np.full(
+            (len(self.channels), _STATE_LEN), np.nan, dtype=np.float64
+        )
+        # one bound call returning all channel values plus the timestamp as a
+        # tuple (always >= 2 names, so attrgetter never returns a bare scalar)
+        self._get_values = operator.attrgetter(*self.channels, "timestamp")
+
+        # Default 3-phase case: three scalar kernel calls on row views beat
+        # the batched kernel's per-sample numpy dispatch; bind the unrolled
+        # path as this instance's update.
+        if len(self.channels) == 3:
+            self._s0 = self._states[0]
+            self._s1 = self._states[1]
+            self._s2 = self._states[2]
+            self.update = self._update3  # type: ignore[method-assign]
 
     def reset(self) -> None:
-        for core in self.cores.values():
-            core.reset()
+        self._states.fill(np.nan)
         super().reset()
 
     def update(self, measures: PMU_Input) -> PMU_Output:
-        # Prefer direct attribute access over getattr for fixed names (ruff B009)
-        ts: float = float(measures.timestamp)
-
-        f_list: list[float] = []
-        r_list: list[float] = []
-        for ch, core in self.cores.items():
-            # ch es PhasorName, garantizado en self.channels
-            x = float(getattr(measures, ch, 0.0))
-            f, r, _crossed, _tc = core.update_scalar(x, ts)
-            f_list.append(f)
-            r_list.append(r)
+        n = len(self.channels)
+        *vals, ts = self._get_values(measures)
+        ts = float(ts)
+        x = np.fromiter(vals, dtype=np.float64, count=n)
+
+        cfg = self.cfg
+        freq, rocof, _crossed, _tc = _zcd_step_batch(
+            self._states, x, ts, cfg.epsilon, self._mode_code, cfg.min_period_s, cfg.max_period_s
+        )
+        freq = np.where(np.isnan(freq), cfg.nominal_hz, freq)
 
         # aggregate across phases (robust by default via median)
-        f_hat = _agg(f_list, self.agg_mode)
-        r_hat = _agg(r_list, self.agg_mode)
+        f_hat = _agg(freq.tolist(), self.agg_mode)
+        r_hat = _agg(rocof.tolist(), self.agg_mode)
+
+        # Phasors are placeholder instantaneous values; only build the dict
+        # (3-6 complex() allocations per sample) when a consumer opts in.
+        phasors: PhasorMap = _EMPTY_PHASORS
+        if self.emit_phasors:
+            typed: dict[PhasorName, complex] = {
+                ch: complex(v, 0.0) for ch, v in zip(self.channels, vals, strict=True)
+            }
+            phasors = typed
+
+        return PMU_Output(
+            phasors=phasors,
+            frequency_hz=float(f_hat),
+            rocof_hz_s=float(r_hat),
+            timestamp_utc=ts,
+        )
 
-        # Phasors con claves tipadas como PhasorName (cumple PhasorMap)
-        phasors: dict[PhasorName, complex] = {
-            ch: complex(float(getattr(measures, ch, 0.0)), 0.0) for ch in self.channels
-        }
-        phasors_typed: PhasorMap = phasors
+    def _update3(self, measures: PMU_Input) -> PMU_Output:
+        """Unrolled 3-phase update: no array building, no iterator protocol."""
+        v0, v1, v2, ts = self._get_values(measures)
+        ts = float(ts)
+        cfg = self.cfg
+        eps = cfg.epsilon
+        mc = self._mode_code
+        mn = cfg.min_period_s
+        mx = cfg.max_period_s
+
+        s0, s1, s2 = self._s0, self._s1, self._s2
+        r0 = _zcd_step(s0, float(v0), ts, eps, mc, mn, mx)
+        r1 = _zcd_step(s1, float(v1), ts, eps, mc, mn, mx)
+        r2 = _zcd_step(s2, float(v2), ts, eps, mc, mn, mx)
+        nominal = cfg.nominal_hz
+        f0 = s0[4]
+        f1 = s1[4]
+        f2 = s2[4]
+        f0 = nominal if math.isnan(f0) else f0
+        f1 = nominal if math.isnan(f1) else f1
+        f2 = nominal if math.isnan(f2) else f2
+
+        if self.agg_mode == "mean":
+            f_hat = (f0 + f1 + f2) / 3.0
+            r_hat = (r0 + r1 + r2) / 3.0
+        else:
+            f_hat = _median3(f0, f1, f2)
+            r_hat = _median3(r0, r1, r2)
+
+        phasors: PhasorMap = _EMPTY_PHASORS
+        if self.emit_phasors:
+            ch = self.channels
+            typed: dict[PhasorName, complex] = {
+                ch[0]: complex(v0, 0.0),
+                ch[1]: complex(v1, 0.0),
+                ch[2]: complex(v2, 0.0),
+            }
+            phasors = typed
 
         return PMU_Output(
-            phasors=phasors_typed,
+            phasors=phasors,
             frequency_hz=float(f_hat),
             rocof_hz_s=float(r_hat),
             timestamp_utc=ts,
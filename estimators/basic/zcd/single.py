@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Literal, cast
+import operator
+from typing import Any, Literal
+
+import numpy as np
+from numpy.typing import NDArray
 
 from estimators.base import EstimatorBase
 from utils.pmu.pmu_input import PMU_Input
 from utils.pmu.pmu_output import PMU_Output
 
-from .core import ZCDConfig, ZCDEstimatorBase
+from .core import ZCDConfig, ZCDEstimatorBase, _normalize_mode, zcd_batch
+
+__all__ = ["ZCDSingle"]
 
 
 def _cfg_get(cfg: Any, attr: str, key: str, default: Any) -> Any:
@@ -20,15 +26,6 @@ def _cfg_get(cfg: Any, attr: str, key: str, default: Any) -> Any:
             return default
 
 
-def _normalize_mode(
-    value: Any, default: Literal["neg_to_pos"] = "neg_to_pos"
-) -> Literal["neg_to_pos", "pos_to_neg", "either"]:
-    """Coerce arbitrary config value to a valid ZCD mode literal."""
-    allowed = {"neg_to_pos", "pos_to_neg", "either"}
-    s = str(value) if value is not None else ""
-    return cast(Literal["neg_to_pos", "pos_to_neg", "either"], s if s in allowed else default)
-
-
 class ZCDSingle(EstimatorBase):
     def __init__(
         self, config: Any, name: str = "zcd_single", profile: Literal["P", "M"] = "M"
@@ -44,14 +41,48 @@ class ZCDSingle(EstimatorBase):
 
         self.zcd = ZCDEstimatorBase(ZCDConfig(epsilon=eps, nominal_hz=nominal, mode=mode))
         self.channel: str = str(_cfg_get(config, "channel", "channel", "V1"))
+        # Pre-bound fetch of (value, timestamp) — one C-level call per sample
+        # instead of two getattr lookups in the hot path.
+        self._get = operator.attrgetter(self.channel, "timestamp")
 
     def update(self, measures: PMU_Input) -> PMU_Output:
-        x = float(getattr(measures, self.channel))
-        ts = float(measures.timestamp)  # Ruff B009: direct attribute access
-        f, r, _crossed, _t_cross = self.zcd.update_scalar(x, ts)
+        x, ts = self._get(measures)
+        ts = float(ts)
+        f, r, _crossed, _t_cross = self.zcd.update_scalar(float(x), ts)
         return PMU_Output(
             phasors={},
             frequency_hz=float(f),
             rocof_hz_s=float(r),
             timestamp_utc=ts,
         )
+
+    def update_batch(
+        self,
+        x: NDArray[np.float64],
+        ts: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Vectorized whole-trace path: one ``zcd_batch`` call over all samples
+        instead of a per-sample ``update`` loop, returning per-sample
+        ``(freq_hz, rocof_hz_s)`` arrays. Uses the same deadband / mode /
+        period-filter config as the streaming path but is stateless across
+        calls — feed it the complete channel trace.
+        """
+        freq, rocof, _crossed, _t_cross = zcd_batch(x, ts, self.zcd.cfg)
+        return freq, rocof
+
+    def process_array(
+        self,
+        signal: NDArray[np.float64],
+        t0: float,
+        dt: float,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Whole-trace path for uniformly sampled input: builds the timestamp
+        grid from ``t0``/``dt`` and runs the vectorized kernel, so pipeline
+        callers skip PMU_Input construction entirely. Returns per-sample
+        ``(freq_hz, rocof_hz_s)`` like ``update_batch``.
+        """
+        signal = np.asarray(signal, dtype=np.float64)
+        ts = t0 + dt * np.arange(signal.shape[0], dtype=np.float64)
+        return self.update_batch(signal, ts)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Mapping
 
 from matplotlib import gridspec, pyplot
 import numpy as np
@@ -8,10 +8,41 @@ from brokenaxes import brokenaxes
 from matplotlib.figure import Figure
 
 
+def _downsample_minmax(
+    t: np.ndarray, y: np.ndarray, target_px: int = 4000
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max decimation for plotting: bin the trace to ~``target_px`` bins and
+    keep each bin's extremes (in sample order), so the rendered envelope is
+    identical while matplotlib draws thousands of points instead of millions.
+    Traces already at or below the target are returned untouched.
+    """
+    n = y.shape[0]
+    if n <= 2 * target_px:
+        return t, y
+    bin_w = n // target_px
+    n_bins = n // bin_w
+    yb = y[: n_bins * bin_w].reshape(n_bins, bin_w)
+    tb = t[: n_bins * bin_w].reshape(n_bins, bin_w)
+    lo = np.argmin(yb, axis=1)
+    hi = np.argmax(yb, axis=1)
+    rows = np.arange(n_bins)
+    # order the (min, max) pair within each bin by time of occurrence
+    first = np.minimum(lo, hi)
+    second = np.maximum(lo, hi)
+    t_out = np.empty(2 * n_bins, dtype=t.dtype)
+    y_out = np.empty(2 * n_bins, dtype=y.dtype)
+    t_out[0::2] = tb[rows, first]
+    t_out[1::2] = tb[rows, second]
+    y_out[0::2] = yb[rows, first]
+    y_out[1::2] = yb[rows, second]
+    return t_out, y_out
+
+
 def plot_signal_and_estimators(
     signal: np.ndarray,
     f_true: np.ndarray,
-    estimates: Mapping[str, Sequence[float]],
+    estimates: Mapping[str, np.ndarray],
     fs: float,
     title: str = "Scenario",
     zoom_windows_top: Iterable[tuple[float, float]] | None = None,
@@ -28,14 +59,19 @@ def plot_signal_and_estimators(
     if zoom_windows_top:
         bax = brokenaxes(xlims=list(zoom_windows_top), hspace=0.05, fig=fig, subplot_spec=gs[0])
         for t0, t1 in zoom_windows_top:
-            mask = (t >= t0) & (t <= t1)
-            bax.plot(t[mask], signal[mask], linewidth=1.0, label=f"{t0}-{t1}s")
+            # t is monotonic: binary-search the window bounds instead of
+            # allocating a full-length boolean mask per zoom window
+            i0 = int(np.searchsorted(t, t0, side="left"))
+            i1 = int(np.searchsorted(t, t1, side="right"))
+            tw, yw = _downsample_minmax(t[i0:i1], signal[i0:i1])
+            bax.plot(tw, yw, linewidth=1.0, label=f"{t0}-{t1}s")
         bax.set_ylabel("Amplitude", fontsize=9)
         bax.legend(fontsize=7, loc="best", framealpha=0.9)
         bax.set_title(f"{title} — AC Signal (zoomed ranges)", fontsize=9)
     else:
         ax0 = fig.add_subplot(gs[0])
-        ax0.plot(t, signal, linewidth=1.0)
+        td, yd = _downsample_minmax(t, signal)
+        ax0.plot(td, yd, linewidth=1.0)
         ax0.set_ylabel("Amplitude", fontsize=9)
         ax0.set_title(f"{title} — AC Signal (full)", fontsize=9)
         ax0.grid(True, which="both", linestyle="--", linewidth=0.5)
@@ -62,9 +98,12 @@ def plot_signal_and_estimators(
     if zoom_window_bottom is not None:
         t0, t1 = zoom_window_bottom
         ax1.set_xlim(t0, t1)
-        mask = (t >= t0) & (t <= t1)
-        if np.any(mask):
-            f_ref = float(np.mean(f_true[: t.size][mask]))
+        # same searchsorted slicing as the zoom windows above
+        i0 = int(np.searchsorted(t, t0, side="left"))
+        i1 = int(np.searchsorted(t, t1, side="right"))
+        window = f_true[: t.size][i0:i1]
+        if window.size:
+            f_ref = float(window.mean())
             margin = 0.15 * f_ref
             ax1.set_ylim(f_ref - margin, f_ref + margin)
 
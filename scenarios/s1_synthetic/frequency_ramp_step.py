@@ -1,11 +1,14 @@
 # scenarios/s1_synthetic/frequency_ramp_step.py
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import numpy as np
 from numpy.typing import NDArray
 
+from .synth import SynthTrace, _time_base, _trace_buffers, sine_from_freq
+
 
 @dataclass(frozen=True)
 class RampStepConfig:
@@ -26,7 +29,8 @@ def frequency_ramp_step(
     duration: float = 6.0,
     fs: int = 5000,
     rocof: float = 1.0,
-) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    dtype: np.dtype | type = np.float32,
+) -> SynthTrace:
     """
     Generate a sinusoidal waveform with a smooth frequency disturbance:
     ramp from cfg.f0 to cfg.f_step at a given RoCoF, hold, then ramp back.
@@ -42,10 +46,13 @@ def frequency_ramp_step(
         Sampling rate (Hz). Must be > 0.
     rocof : float
         Rate of change of frequency during ramps (Hz/s). If 0, ramps are skipped.
+    dtype : np.dtype | type
+        Output dtype of the signal (float32 by default — downstream only
+        needs sign changes; phase still accumulates in float64).
 
     Returns
     -------
-    signal : NDArray[np.float64]
+    signal : NDArray[np.floating]
         Generated sinusoidal signal.
     f : NDArray[np.float64]
         Instantaneous frequency array (Hz).
@@ -57,29 +64,55 @@ def frequency_ramp_step(
     if duration < 0:
         raise ValueError("duration must be >= 0")
 
-    dt = 1.0 / float(fs)
-    t: NDArray[np.float64] = np.arange(0.0, duration, dt, dtype=float)
-    f: NDArray[np.float64] = np.full_like(t, cfg.f0, dtype=float)
+    # Cached read-only time base; f lives in the shared trace buffer
+    # (paired with the signal row when the dtypes match)
+    t: NDArray[np.float64] = _time_base(float(duration), float(fs))
+    f, sig_out = _trace_buffers(t.shape[0], dtype)
+    f.fill(cfg.f0)
 
     # Time needed to complete each ramp (avoid div-by-zero if rocof == 0)
     ramp_time = float(abs(cfg.f_step - cfg.f0) / rocof) if rocof > 0.0 else 0.0
     sgn = 1.0 if (cfg.f_step - cfg.f0) >= 0.0 else -1.0
 
-    # Scalar logic kept; can be vectorized later if needed
-    for i, ti in enumerate(t):
-        if ti < cfg.t_step:
-            f[i] = cfg.f0
-        elif cfg.t_step <= ti < cfg.t_step + ramp_time:
-            f[i] = cfg.f0 + sgn * rocof * (ti - cfg.t_step)
-        elif cfg.t_step + ramp_time <= ti < cfg.t_back:
-            f[i] = cfg.f_step
-        elif cfg.t_back <= ti < cfg.t_back + ramp_time:
-            f[i] = cfg.f_step - sgn * rocof * (ti - cfg.t_back)
-        else:
-            f[i] = cfg.f0
-
-    theta: NDArray[np.float64] = (2.0 * np.pi * np.cumsum(f) / float(fs)).astype(
-        np.float64, copy=False
+    # The five regions are contiguous runs on a monotonic time base, so four
+    # binary searches give their integer boundaries and each region becomes a
+    # slice store — no N-sized boolean temporaries. f is prefilled with f0
+    # (regions 1 and 5).
+    i1, i2, i3, i4 = np.searchsorted(
+        t,
+        (cfg.t_step, cfg.t_step + ramp_time, cfg.t_back, cfg.t_back + ramp_time),
+        side="left",
     )
-    signal: NDArray[np.float64] = np.sin(theta).astype(np.float64, copy=False)
-    return signal, f
+    f[i1:i2] = cfg.f0 + sgn * rocof * (t[i1:i2] - cfg.t_step)
+    f[i2:i3] = cfg.f_step
+    f[i3:i4] = cfg.f_step - sgn * rocof * (t[i3:i4] - cfg.t_back)
+
+    signal: NDArray[np.floating] = sine_from_freq(f, float(fs), dtype=dtype, out=sig_out)
+    return SynthTrace(signal, f)
+
+
+def compile_ramp_step(
+    cfg: RampStepConfig | None = None,
+    duration: float = 6.0,
+    fs: int = 5000,
+    rocof: float = 1.0,
+    dtype: np.dtype | type = np.float32,
+) -> Callable[[], SynthTrace]:
+    """
+    Partially evaluate ``frequency_ramp_step`` for a fixed configuration.
+
+    The profile and signal depend only on the arguments, so they are
+    generated once here; the returned zero-argument closure just hands back
+    the cached pair. Useful for benchmark sweeps that regenerate the same
+    scenario per estimator. Callers must treat the arrays as read-only
+    (they are flagged non-writeable); copy before mutating.
+    """
+    signal, f = frequency_ramp_step(cfg, duration, fs, rocof, dtype)
+    signal.setflags(write=False)
+    f.setflags(write=False)
+    trace = SynthTrace(signal, f)
+
+    def scenario() -> SynthTrace:
+        return trace
+
+    return scenario
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
+from .synth import SynthTrace, _time_base, _trace_buffers, sine_from_freq
+
 
 def frequency_step(
     f0: float = 60.0,
@@ -10,7 +12,8 @@ def frequency_step(
     t_back: float = 4.0,
     duration: float = 6.0,
     fs: float = 5000.0,
-) -> tuple[np.ndarray, np.ndarray]:
+    dtype: np.dtype | type = np.float32,
+) -> SynthTrace:
     """
     Generate a sinusoidal waveform with a step change in frequency.
 
@@ -28,6 +31,9 @@ def frequency_step(
         Total duration (s).
     fs : float
         Sampling frequency (Hz).
+    dtype : np.dtype | type
+        Output dtype of the signal (float32 by default — downstream only
+        needs sign changes; phase still accumulates in float64).
 
     Returns
     -------
@@ -37,16 +43,19 @@ def frequency_step(
         Instantaneous frequency array (Hz) (shape: [N]).
     """
     fs = float(fs)
-    # Time base (half-open interval [0, duration))
-    t = np.arange(0.0, float(duration), 1.0 / fs, dtype=float)
-
-    # Piecewise frequency profile
-    f = np.full_like(t, float(f0), dtype=float)
-    step_mask = (t >= float(t_step)) & (t < float(t_back))
-    f[step_mask] = float(f_step)
-
-    # Phase accumulation and signal
-    theta = 2.0 * np.pi * np.cumsum(f) / fs
-    signal = np.sin(theta).astype(float, copy=False)
-
-    return signal, f
+    # Cached time base (half-open interval [0, duration), read-only)
+    t = _time_base(float(duration), fs)
+
+    # Piecewise frequency profile: the step region is contiguous, so two
+    # binary searches and a slice store replace the full boolean mask
+    # (no N-sized temporaries, sequential writes). f lives in the shared
+    # trace buffer (paired with the signal row when the dtypes match).
+    f, sig_out = _trace_buffers(t.shape[0], dtype)
+    f.fill(float(f0))
+    i0 = int(np.searchsorted(t, float(t_step), side="left"))
+    i1 = int(np.searchsorted(t, float(t_back), side="left"))
+    f[i0:i1] = float(f_step)
+
+    signal = sine_from_freq(f, fs, dtype=dtype, out=sig_out)
+
+    return SynthTrace(signal, f)
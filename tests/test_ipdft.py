@@ -36,3 +36,24 @@ def test_ipdft_smoke() -> None:
     freqs = np.array([o.frequency_hz for o in out], dtype=float)
     mean_freq = float(freqs.mean())
     assert abs(mean_freq - 60.0) < 2.0
+
+
+def test_ipdft_edge_bin_bounded() -> None:
+    # Con frame_len por defecto (50 @ 5 kHz -> bins de 100 Hz) el pico de una
+    # senoidal de 60 Hz cae en el bin 0: la interpolación parabólica no es
+    # válida ahí y no debe producir frecuencias desorbitadas.
+    fs = 5000
+    sig, _truth = make_clean(f0=60.0, df=0.0, duration=0.2, fs=fs)
+
+    est = IpDFT(config={"fs": fs})
+    freqs = []
+    for n, x in enumerate(sig):
+        measures = PMU_Input(timestamp=n / fs, V1=float(x), V2=0.0, V3=0.0, I1=0.0, I2=0.0, I3=0.0)
+        freqs.append(est.update(measures).frequency_hz)
+
+    arr = np.array(freqs, dtype=float)
+    assert np.all(np.isfinite(arr))
+    # acotado al ancho de un bin alrededor del pico rastreado (sin el guard,
+    # los excursos llegaban a miles de Hz)
+    assert np.all(arr >= 0.0)
+    assert np.all(arr <= 200.0)
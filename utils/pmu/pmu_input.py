@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-
-import numpy as np
+from math import isfinite
 
 
 # ---- Data carriers ----------------------------------------------------------
@@ -18,7 +17,14 @@ class PMU_Input:
     timestamp: float  # high-precision UNIX UTC
 
     def validate(self) -> None:
-        if not np.isfinite(
-            [self.V1, self.V2, self.V3, self.I1, self.I2, self.I3, self.timestamp]
-        ).all():
+        # Short-circuiting scalar checks: no list/array allocation per call
+        if not (
+            isfinite(self.V1)
+            and isfinite(self.V2)
+            and isfinite(self.V3)
+            and isfinite(self.I1)
+            and isfinite(self.I2)
+            and isfinite(self.I3)
+            and isfinite(self.timestamp)
+        ):
             raise ValueError("Non-finite value in input sample.")
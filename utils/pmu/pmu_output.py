@@ -1,13 +1,12 @@
 # utils/pmu/pmu_output.py
 from __future__ import annotations
 
+import cmath
 from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum, IntFlag
 from typing import Literal
 
-import numpy as np
-
 __all__ = ["PhasorName", "PhasorMap", "PMUStatus", "PMUClass", "PMU_Output"]
 
 PhasorName = Literal["V1", "V2", "V3", "I1", "I2", "I3"]
@@ -42,7 +41,9 @@ class PMU_Output:
             "ROCOF_HZ_S": float(self.rocof_hz_s),
             "STATUS_WORD": int(self.status_word),
         }
+        # Scalar C-level ops: abs/cmath.phase skip the numpy ufunc dispatch
+        # that np.abs/np.angle pay on a single complex value.
         for name, p in self.phasors.items():
-            out[f"{name}_MAG"] = float(np.abs(p))
-            out[f"{name}_ANGLE_RAD"] = float(np.angle(p))
+            out[f"{name}_MAG"] = abs(p)
+            out[f"{name}_ANGLE_RAD"] = cmath.phase(p)
         return out